@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+DUCK-WOD Analytics Benchmark
+Times WodTable over synthetic history (years x sources) against the
+hand-written nested loops it replaces
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analytics import stats
+from analytics.stats import WodTable, MOVEMENT_RES
+
+
+LINE_TEMPLATES = [
+    "{n} burpees", "{n} wall balls", "{n} pull ups", "{n} kb swings",
+    "{n} box jumps", "{n} double unders", "{n} thrusters", "{n} lunges",
+    "{n}m run", "{n} cal bike", "{n}m row", "back squat 5x5 @ 75%",
+]
+TITLES = ["warm up", "strength", "amrap 12", "emom 10", "3 rounds for time:"]
+
+
+def synthetic_history(years, sources, seed=0):
+    rng = random.Random(seed)
+    end = date(2026, 1, 1)
+    days = years * 365
+
+    return {
+        "sources": [
+            {
+                "id": f"source_{s}",
+                "wods": [
+                    {
+                        "date": (end - timedelta(days=d)).isoformat(),
+                        "sections": [
+                            {
+                                "title": rng.choice(TITLES),
+                                "lines": [
+                                    rng.choice(LINE_TEMPLATES).format(n=rng.randint(5, 50))
+                                    for _ in range(rng.randint(3, 8))
+                                ],
+                            }
+                            for _ in range(rng.randint(2, 4))
+                        ],
+                    }
+                    for d in range(days)
+                ],
+            }
+            for s in range(sources)
+        ]
+    }
+
+
+def loop_movement_frequency(data, start, end):
+    """Baseline: nested loops over the JSON on every query"""
+    result = {}
+    for source in data["sources"]:
+        counts = result.setdefault(source["id"], {})
+        for wod in source["wods"]:
+            if not start <= wod["date"] <= end:
+                continue
+            for section in wod["sections"]:
+                for line in section["lines"]:
+                    lower = line.lower()
+                    for name, pattern in zip(stats.MOVEMENTS, MOVEMENT_RES):
+                        if pattern.search(lower):
+                            counts[name] = counts.get(name, 0) + 1
+    return result
+
+
+def timed(label, fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    print(f"  {label:<32} {time.perf_counter() - started:8.3f}s")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark WOD analytics")
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--sources", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=20,
+                        help="date-range queries per run")
+    args = parser.parse_args(argv)
+
+    data = synthetic_history(args.years, args.sources)
+    wods = args.years * 365 * args.sources
+    print(f"🦆 {wods} synthetic WODs ({args.years} years x {args.sources} sources)")
+
+    rng = random.Random(1)
+    first = date(2026, 1, 1) - timedelta(days=args.years * 365)
+    ranges = []
+    for _ in range(args.queries):
+        a = first + timedelta(days=rng.randrange(args.years * 365))
+        b = a + timedelta(days=rng.randrange(7, 365))
+        ranges.append((a.isoformat(), b.isoformat()))
+
+    backends = [False] + ([True] if stats.np is not None else [])
+    for use_numpy in backends:
+        print(f"\n{'numpy' if use_numpy else 'pure python'}:")
+        table = timed("flatten", WodTable, data, use_numpy)
+        timed(
+            f"{args.queries} x movement_frequency",
+            lambda: [table.movement_frequency(a, b) for a, b in ranges]
+        )
+        timed(
+            f"{args.queries} x weekly_volume",
+            lambda: [table.weekly_volume(a, b) for a, b in ranges]
+        )
+        timed(
+            f"{args.queries} x format_frequency",
+            lambda: [table.format_frequency(a, b) for a, b in ranges]
+        )
+
+    print("\nnested loops:")
+    timed(
+        f"{args.queries} x movement_frequency",
+        lambda: [loop_movement_frequency(data, a, b) for a, b in ranges]
+    )
+
+
+if __name__ == "__main__":
+    main()
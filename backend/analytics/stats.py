@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+DUCK-WOD Analytics
+Flattens wods.json into columnar arrays once, then answers batched queries:
+- Movement frequency per source
+- Weekly volume (WODs, lines, leading rep counts) per source
+- Workout format frequency per source
+NumPy is used when installed, with a pure-Python fallback
+"""
+
+import argparse
+import json
+import re
+from datetime import date
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # optional - pure-Python aggregation without it
+    np = None
+
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+WODS_FILE = BASE_DIR / "data" / "wods.json"
+STATS_DIR = BASE_DIR / "data" / "stats"
+
+MOVEMENTS = {
+    "squat": r"squats?",
+    "deadlift": r"deadlifts?",
+    "clean": r"cleans?",
+    "snatch": r"snatch(es)?",
+    "jerk": r"jerks?",
+    "thruster": r"thrusters?",
+    "wall ball": r"wall ?balls?",
+    "pull-up": r"pull[ -]?ups?",
+    "push-up": r"(?<!handstand )push[ -]?ups?",
+    "handstand push-up": r"handstand push[ -]?ups?|hspu",
+    "burpee": r"burpees?",
+    "box jump": r"box jumps?",
+    "double under": r"double[ -]?unders?",
+    "muscle-up": r"muscle[ -]?ups?",
+    "toes-to-bar": r"toes[ -]?to[ -]?bar|t2b|ttb",
+    "kettlebell swing": r"(kb|kettlebell) swings?",
+    "lunge": r"lunges?",
+    "row": r"row(s|ing)?",
+    "run": r"run(s|ning)?",
+    "bike": r"bike",
+}
+
+FORMATS = {
+    "amrap": r"\bamrap\b",
+    "emom": r"\be\d*mom\b",
+    "for time": r"\bfor time\b",
+    "rounds": r"\b\d+\s*rounds\b",
+    "tabata": r"\btabata\b",
+    "strength": r"\b\d+\s*x\s*\d+\b|\d+\s*%",
+}
+
+MOVEMENT_RES = [
+    re.compile(rf"\b(?:{pattern})\b") for pattern in MOVEMENTS.values()
+]
+FORMAT_RES = [re.compile(pattern) for pattern in FORMATS.values()]
+
+# "10 burpees" -> 10; distances, times and round counts are not reps
+REPS_RE = re.compile(r"^(\d+)\s+(?!m\b|km\b|cal|sec|min|rounds?\b)")
+
+
+def parse_date(value):
+    return date.fromisoformat(value).toordinal() if value else None
+
+
+def week_start(ordinal):
+    """Ordinal of the Monday of the ordinal's week (day 1 is a Monday)"""
+    return ordinal - (ordinal - 1) % 7
+
+
+class WodTable:
+    """
+    Columnar view of wods.json.
+    Every column is a flat array (NumPy if available, else a list); rows of
+    the wod, line, movement-hit and format-hit tables all carry their source
+    code and date ordinal so queries never touch the nested JSON again.
+    """
+
+    def __init__(self, data, use_numpy=None):
+        self.numpy = (np is not None) if use_numpy is None else use_numpy
+        if self.numpy and np is None:
+            raise ImportError("numpy is not installed")
+
+        self.source_ids = []
+
+        wod_source, wod_date = [], []
+        line_source, line_date, line_reps = [], [], []
+        move_source, move_date, move_code = [], [], []
+        fmt_source, fmt_date, fmt_code = [], [], []
+
+        for code, source in enumerate(data.get("sources", [])):
+            self.source_ids.append(source["id"])
+
+            for wod in source.get("wods", []):
+                day = parse_date(wod["date"])
+                wod_source.append(code)
+                wod_date.append(day)
+
+                texts = []
+                for section in wod.get("sections", []):
+                    texts.append(section.get("title", "").lower())
+                    for line in section.get("lines", []):
+                        lower = line.lower()
+                        texts.append(lower)
+
+                        line_source.append(code)
+                        line_date.append(day)
+                        match = REPS_RE.match(lower)
+                        line_reps.append(int(match.group(1)) if match else 0)
+
+                        for movement, pattern in enumerate(MOVEMENT_RES):
+                            if pattern.search(lower):
+                                move_source.append(code)
+                                move_date.append(day)
+                                move_code.append(movement)
+
+                text = "\n".join(texts)
+                for fmt, pattern in enumerate(FORMAT_RES):
+                    if pattern.search(text):
+                        fmt_source.append(code)
+                        fmt_date.append(day)
+                        fmt_code.append(fmt)
+
+        column = self._column
+        self.wod_source, self.wod_date = column(wod_source), column(wod_date)
+        self.line_source, self.line_date = column(line_source), column(line_date)
+        self.line_reps = column(line_reps)
+        self.move_source, self.move_date = column(move_source), column(move_date)
+        self.move_code = column(move_code)
+        self.fmt_source, self.fmt_date = column(fmt_source), column(fmt_date)
+        self.fmt_code = column(fmt_code)
+
+    @classmethod
+    def load(cls, path=WODS_FILE, use_numpy=None):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f), use_numpy=use_numpy)
+
+    def _column(self, values):
+        return np.asarray(values, dtype=np.int64) if self.numpy else values
+
+    # --- Batched primitives ---
+    def _mask(self, source_col, date_col, start, end, sources):
+        """Row filter for a date range (inclusive) and a set of source ids"""
+        start, end = parse_date(start), parse_date(end)
+        codes = None
+        if sources:
+            codes = {i for i, s in enumerate(self.source_ids) if s in sources}
+
+        if self.numpy:
+            mask = np.ones(len(date_col), dtype=bool)
+            if start is not None:
+                mask &= date_col >= start
+            if end is not None:
+                mask &= date_col <= end
+            if codes is not None:
+                mask &= np.isin(source_col, list(codes))
+            return mask
+
+        return [
+            (start is None or d >= start)
+            and (end is None or d <= end)
+            and (codes is None or s in codes)
+            for s, d in zip(source_col, date_col)
+        ]
+
+    def _group_sum(self, source_col, key_col, mask, weights=None):
+        """Sum weights (or count rows) per (source, key) over masked rows"""
+        if self.numpy:
+            # Pack both columns into one int64 so grouping is a 1-D unique
+            packed = (source_col[mask] << 32) | key_col[mask]
+            if len(packed) == 0:
+                return {}
+            unique, inverse = np.unique(packed, return_inverse=True)
+            totals = np.bincount(
+                inverse.ravel(),
+                weights=None if weights is None else weights[mask]
+            )
+            return {
+                (int(key >> 32), int(key & 0xFFFFFFFF)): int(total)
+                for key, total in zip(unique, totals)
+            }
+
+        totals = {}
+        for i, keep in enumerate(mask):
+            if keep:
+                key = (source_col[i], key_col[i])
+                totals[key] = totals.get(key, 0) + (1 if weights is None else weights[i])
+        return totals
+
+    def _weeks(self, date_col):
+        if self.numpy:
+            return date_col - (date_col - 1) % 7
+        return [week_start(d) for d in date_col]
+
+    def _per_source(self, totals, labels):
+        """{(source_code, label_code): n} -> {source_id: {label: n}}"""
+        result = {}
+        for (code, label), total in sorted(totals.items()):
+            result.setdefault(self.source_ids[code], {})[labels[label]] = total
+        return result
+
+    # --- Queries ---
+    def movement_frequency(self, start=None, end=None, sources=None):
+        """Lines mentioning each movement, per source"""
+        mask = self._mask(self.move_source, self.move_date, start, end, sources)
+        totals = self._group_sum(self.move_source, self.move_code, mask)
+        return self._per_source(totals, list(MOVEMENTS))
+
+    def format_frequency(self, start=None, end=None, sources=None):
+        """WODs using each format (a WOD can have several), per source"""
+        mask = self._mask(self.fmt_source, self.fmt_date, start, end, sources)
+        totals = self._group_sum(self.fmt_source, self.fmt_code, mask)
+        return self._per_source(totals, list(FORMATS))
+
+    def weekly_volume(self, start=None, end=None, sources=None):
+        """WODs, lines and leading rep counts per ISO week, per source"""
+        wod_mask = self._mask(self.wod_source, self.wod_date, start, end, sources)
+        line_mask = self._mask(self.line_source, self.line_date, start, end, sources)
+        wod_weeks = self._weeks(self.wod_date)
+        line_weeks = self._weeks(self.line_date)
+
+        metrics = {
+            "wods": self._group_sum(self.wod_source, wod_weeks, wod_mask),
+            "lines": self._group_sum(self.line_source, line_weeks, line_mask),
+            "reps": self._group_sum(
+                self.line_source, line_weeks, line_mask, self.line_reps
+            ),
+        }
+
+        result = {}
+        for metric, totals in metrics.items():
+            for (code, week), total in totals.items():
+                weeks = result.setdefault(self.source_ids[code], {})
+                row = weeks.setdefault(
+                    date.fromordinal(week).isoformat(),
+                    {"wods": 0, "lines": 0, "reps": 0}
+                )
+                row[metric] = total
+
+        return {
+            source_id: dict(sorted(weeks.items()))
+            for source_id, weeks in result.items()
+        }
+
+    def summary(self, start=None, end=None, sources=None):
+        return {
+            "movement_frequency": self.movement_frequency(start, end, sources),
+            "format_frequency": self.format_frequency(start, end, sources),
+            "weekly_volume": self.weekly_volume(start, end, sources),
+        }
+
+
+def save_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write WOD history statistics")
+    parser.add_argument("--wods", type=Path, default=WODS_FILE, help="wods.json to read")
+    parser.add_argument("--out", type=Path, default=STATS_DIR, help="output directory")
+    parser.add_argument("--start", help="first date (YYYY-MM-DD), inclusive")
+    parser.add_argument("--end", help="last date (YYYY-MM-DD), inclusive")
+    parser.add_argument("--source", action="append", dest="sources",
+                        help="limit to a source id (repeatable)")
+    args = parser.parse_args(argv)
+
+    table = WodTable.load(args.wods)
+    stats = table.summary(args.start, args.end, args.sources)
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    for name, data in stats.items():
+        save_json(args.out / f"{name}.json", data)
+        print(f"📊 {name}.json written")
+
+
+if __name__ == "__main__":
+    main()
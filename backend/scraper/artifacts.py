@@ -0,0 +1,98 @@
+"""
+DUCK-WOD Data Artifacts
+Minified + pre-compressed copies of wods.json for the static frontend
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional - .br variant is skipped without it
+    brotli = None
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def minify_json(data):
+    """Canonical, whitespace-free JSON bytes"""
+    return json.dumps(
+        data, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def load_manifest(out_dir):
+    path = Path(out_dir) / MANIFEST_NAME
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def build_artifacts(data, out_dir, name="wods"):
+    """
+    Write <name>.<hash>.min.json plus .gz/.br variants and a manifest.
+    Nothing is rewritten if the manifest already points at the same content.
+    The previous version's files are kept for one more build.
+    Returns: the manifest entry for <name>
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    payload = minify_json(data)
+    digest = hashlib.sha256(payload).hexdigest()
+
+    manifest = load_manifest(out_dir)
+    entry = manifest.get(name)
+    if entry and entry["sha256"] == digest \
+            and (out_dir / entry["file"]).exists():
+        return entry
+
+    filename = f"{name}.{digest[:12]}.min.json"
+
+    # Fixed mtime keeps the .gz byte-identical for identical content
+    variants = {
+        filename: payload,
+        filename + ".gz": gzip.compress(payload, compresslevel=9, mtime=0),
+    }
+    if brotli is not None:
+        variants[filename + ".br"] = brotli.compress(payload, quality=11)
+
+    for file, blob in variants.items():
+        with open(out_dir / file, "wb") as f:
+            f.write(blob)
+
+    # Keep the previous version for clients still holding a cached manifest;
+    # anything older than that is dropped
+    previous = None
+    if entry and entry["file"] != filename:
+        previous = {"file": entry["file"], "sha256": entry["sha256"]}
+    keep = {filename}
+    if previous:
+        keep.add(previous["file"])
+
+    for old in out_dir.glob(f"{name}.*.min.json*"):
+        base = old.name.removesuffix(".gz").removesuffix(".br")
+        if old.name not in variants and base not in keep:
+            old.unlink()
+
+    entry = {
+        "file": filename,
+        "sha256": digest,
+        "sizes": {
+            "json": len(payload),
+            "gzip": len(variants[filename + ".gz"]),
+            "brotli": len(variants[filename + ".br"])
+                      if brotli is not None else None,
+        },
+        "previous": previous,
+    }
+    manifest[name] = entry
+
+    with open(out_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    return entry
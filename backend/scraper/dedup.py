@@ -0,0 +1,150 @@
+"""
+DUCK-WOD Near-Duplicate Detection
+MinHash + LSH over shingled workout lines, so the same workout published
+by several sources (e.g. CrossFit.com main site reposted by gyms) is linked
+"""
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+
+
+NUM_PERM = 64          # MinHash signature length
+BANDS = 16             # LSH bands (BANDS * ROWS == NUM_PERM)
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3       # words per shingle
+THRESHOLD = 0.7        # estimated Jaccard similarity to count as duplicate
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(2026)  # fixed seed -> stable signatures across runs
+_PERMS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME))
+    for _ in range(NUM_PERM)
+]
+
+
+def normalize_line(line):
+    """Lowercase, drop punctuation, collapse whitespace"""
+    line = re.sub(r'[^\w\s]', ' ', line.lower())
+    return re.sub(r'\s+', ' ', line).strip()
+
+
+def shingles(sections):
+    """Word n-grams over the normalised lines of all sections"""
+    words = []
+    for section in sections:
+        for line in section.get('lines', []):
+            words.extend(normalize_line(line).split())
+
+    # Too short to compare ("Rest day") - never treated as a duplicate
+    if len(words) < SHINGLE_SIZE:
+        return set()
+
+    return {
+        ' '.join(words[i:i + SHINGLE_SIZE])
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(shingle_set):
+    """MinHash signature of a shingle set"""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+        for s in shingle_set
+    ]
+    return [
+        min((a * h + b) % _PRIME for h in hashes)
+        for a, b in _PERMS
+    ]
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def find_duplicates(sources):
+    """
+    Group near-identical WODs published by different sources on the same
+    date, so a group never holds two WODs of one source.
+    Returns: [[{'source': id, 'date': date}, ...], ...] - one list per group,
+    canonical WOD (first source in order) first
+    """
+    refs = []
+    signatures = []
+    order = {}
+
+    for index, source in enumerate(sources):
+        order[source['id']] = index
+        for wod in source.get('wods', []):
+            shingle_set = shingles(wod.get('sections', []))
+            if not shingle_set:
+                continue
+            refs.append({'source': source['id'], 'date': wod['date']})
+            signatures.append(minhash(shingle_set))
+
+    # LSH: only WODs of the same date sharing a band bucket are compared
+    buckets = defaultdict(list)
+    for i, sig in enumerate(signatures):
+        for band in range(BANDS):
+            key = (refs[i]['date'], band, tuple(sig[band * ROWS:(band + 1) * ROWS]))
+            buckets[key].append(i)
+
+    parent = list(range(len(refs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    checked = set()
+    for members in buckets.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                i, j = members[x], members[y]
+                if (i, j) in checked or refs[i]['source'] == refs[j]['source']:
+                    continue
+                checked.add((i, j))
+                if similarity(signatures[i], signatures[j]) >= THRESHOLD:
+                    parent[find(i)] = find(j)
+
+    groups = defaultdict(list)
+    for i in range(len(refs)):
+        groups[find(i)].append(refs[i])
+
+    def sort_key(ref):
+        return (ref['date'], order[ref['source']])
+
+    return sorted(
+        (sorted(group, key=sort_key) for group in groups.values() if len(group) > 1),
+        key=lambda group: sort_key(group[0])
+    )
+
+
+if __name__ == '__main__':
+    def wod(day, *lines):
+        return {'date': day, 'sections': [{'title': 'Workout', 'lines': list(lines)}]}
+
+    fran = ('21-15-9 reps for time', 'thrusters 43 kg', 'pull ups')
+
+    # Same WOD every day from 3 sources -> one group per date, one WOD per source
+    sources = [
+        {'id': s, 'wods': [wod(f'2026-01-{d:02d}', *fran) for d in range(1, 15)]}
+        for s in ('a', 'b', 'c')
+    ]
+    groups = find_duplicates(sources)
+    assert len(groups) == 14
+    for group in groups:
+        assert len({ref['date'] for ref in group}) == 1
+        assert sorted(ref['source'] for ref in group) == ['a', 'b', 'c']
+
+    # Short WODs such as "Rest Day" are never linked
+    sources = [
+        {'id': 'a', 'wods': [wod(f'2026-01-0{d}', 'Rest Day') for d in (1, 2, 3)]},
+        {'id': 'b', 'wods': [wod(f'2026-01-0{d}', 'Rest Day') for d in (1, 2, 5)]},
+    ]
+    assert find_duplicates(sources) == []
+
+    print("✅ dedup checks passed")
@@ -0,0 +1,64 @@
+"""
+DUCK-WOD Source Health
+Per-source success rate, latency and failure streak, persisted across runs
+"""
+
+import json
+from datetime import datetime
+
+
+DEGRADED_AFTER = 3      # consecutive failed runs before a source is degraded
+LATENCY_WEIGHT = 0.3    # weight of the newest run in the latency average
+
+
+def load_health(path):
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_health(path, health):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(health, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+
+def new_entry():
+    return {
+        "runs": 0,
+        "successes": 0,
+        "success_rate": None,
+        "last_success": None,
+        "avg_latency": None,
+        "consecutive_failures": 0
+    }
+
+
+def is_degraded(entry):
+    return bool(entry) and entry["consecutive_failures"] >= DEGRADED_AFTER
+
+
+def record_run(health, source_id, success, latencies):
+    """
+    Update a source's entry after a run.
+    success: at least one WOD was fetched; latencies: seconds per request
+    """
+    entry = health.setdefault(source_id, new_entry())
+
+    entry["runs"] += 1
+    if success:
+        entry["successes"] += 1
+        entry["last_success"] = datetime.now().isoformat()
+        entry["consecutive_failures"] = 0
+    else:
+        entry["consecutive_failures"] += 1
+    entry["success_rate"] = round(entry["successes"] / entry["runs"], 3)
+
+    if latencies:
+        latency = sum(latencies) / len(latencies)
+        if entry["avg_latency"] is not None:
+            latency = (LATENCY_WEIGHT * latency
+                       + (1 - LATENCY_WEIGHT) * entry["avg_latency"])
+        entry["avg_latency"] = round(latency, 3)
+
+    return entry
@@ -1,12 +1,22 @@
 #!/usr/bin/env python3
 """
-DUCK-WOD Scraper Runner v2.2
+DUCK-WOD Scraper Runner v2.3
 - Safe merge (never deletes existing data)
 - Supports generic scraper for new sources
+- Change detection: wods.json is only rewritten when WOD content changes
+- Minified + gzip/brotli artifacts with a hashed-filename manifest
+- Near-duplicate WODs across sources are linked in "duplicates"
+- Source health tracking: degraded sources get one probe request per run
+- Optional run deadline (--deadline): most valuable fetches first
 """
 
+import argparse
+import hashlib
 import json
+import math
+import os
 import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -19,14 +29,23 @@ sys.path.insert(0, str(BACKEND_DIR))
 
 from scraper.sources import myleo, crossfit, linchpin
 from scraper.sources import generic  # ✅ generic scraper
+from scraper.artifacts import build_artifacts
+from scraper.dedup import find_duplicates
+from scraper.health import load_health, save_health, is_degraded, record_run
 
 # --- Paths ---
 DATA_DIR = BASE_DIR / "data"
 WODS_FILE = DATA_DIR / "wods.json"
 SOURCES_FILE = DATA_DIR / "sources.json"
+HEALTH_FILE = DATA_DIR / "source_health.json"  # cached between workflow runs
+RUN_META_FILE = DATA_DIR / "run_meta.json"  # volatile, not committed
+DIST_DIR = DATA_DIR / "dist"
 
 DATA_DIR.mkdir(exist_ok=True)
 
+DAYS_BACK = 14
+REQUEST_TIMEOUT = 10  # seconds, as used by the scraper modules
+
 # --- Scraper registry ---
 SCRAPER_MODULES = {
     "myleo": myleo,
@@ -47,8 +66,87 @@ def save_json(path, data):
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
+def content_digest(data):
+    """Stable SHA-256 of JSON-serialisable data (key order independent)"""
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False,
+                           separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def merge_wods(existing_wods, fetched_wods):
+    """
+    Merge freshly fetched WODs into the existing ones, per date.
+    Dates that were not fetched this run are kept as they are.
+    Returns: (merged_wods, changes) where changes lists added/changed dates
+    """
+    merged = {w["date"]: w for w in existing_wods}
+    changes = {"added": [], "changed": [], "unchanged": 0}
+
+    for wod in fetched_wods:
+        date = wod["date"]
+        old = merged.get(date)
+
+        if old is None:
+            changes["added"].append(date)
+        elif content_digest(old) != content_digest(wod):
+            changes["changed"].append(date)
+        else:
+            changes["unchanged"] += 1
+            continue
+
+        merged[date] = wod
+
+    wods = sorted(merged.values(), key=lambda x: x["date"], reverse=True)
+    return wods, changes
+
+
+def write_step_summary(summary):
+    """Append the change summary to the GitHub Actions job summary, if any"""
+    path = os.environ.get("GITHUB_STEP_SUMMARY")
+    if not path:
+        return
+
+    rows = ["| Source | Added | Changed | Unchanged |", "|---|---|---|---|"]
+    for source_id, changes in summary.items():
+        rows.append(
+            f"| {source_id} | {len(changes['added'])} "
+            f"| {len(changes['changed'])} | {changes['unchanged']} |"
+        )
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("### 🦆 WOD changes\n\n" + "\n".join(rows) + "\n")
+
+
+def build_schedule(sources, health, days=DAYS_BACK):
+    """
+    Order (days_back, source) fetches by value: today first, then recent days;
+    within a day, healthy sources before degraded ones, fast before slow
+    """
+    def source_rank(source):
+        entry = health.get(source["id"])
+        return (is_degraded(entry), (entry or {}).get("avg_latency") or 0.0)
+
+    ranked = sorted(sources, key=source_rank)
+    return [(days_back, source) for days_back in range(days) for source in ranked]
+
+
+def positive_seconds(value):
+    seconds = float(value)
+    if not math.isfinite(seconds) or seconds <= 0:
+        raise argparse.ArgumentTypeError("must be a finite number greater than 0")
+    return seconds
+
+
 # --- Main ---
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch WODs from all enabled sources")
+    parser.add_argument(
+        "--deadline", type=positive_seconds, default=None, metavar="SECONDS",
+        help="time budget for starting requests; no request is started once "
+             "less than the 10s request timeout is left"
+    )
+    deadline = parser.parse_args(argv).deadline
+
     print("🦆 DUCK-WOD Fetch Started")
 
     sources = load_json(SOURCES_FILE, [])
@@ -61,64 +159,171 @@ def main():
         s["id"]: s for s in existing_data.get("sources", [])
     }
 
+    health = load_health(HEALTH_FILE)
+
     updated_sources = []
+    summary = {}
 
     today = datetime.now()
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+    enabled_sources = [s for s in sources if s.get("enabled", True)]
+    state = {
+        s["id"]: {
+            "wods": [],
+            "latencies": [],
+            "degraded": is_degraded(health.get(s["id"])),
+            "skip": False,
+            "cut_off": False
+        }
+        for s in enabled_sources
+    }
 
-    for source in sources:
-        if not source.get("enabled", True):
-            continue
+    schedule = build_schedule(enabled_sources, health)
+    cancelled = 0
+    current_day = None
 
+    for index, (days_back, source) in enumerate(schedule):
         source_id = source["id"]
-        source_name = source["name"]
-        source_url = source["url"]
+        source_state = state[source_id]
+        if source_state["skip"]:
+            continue
 
-        print(f"\n🔍 Processing source: {source_name}")
+        # Only limits when requests start: a started request can still run
+        # past the deadline, and the merge/dedup/artifact steps are not budgeted
+        if deadline_at is not None \
+                and time.monotonic() + REQUEST_TIMEOUT > deadline_at:
+            outstanding = [
+                s["id"] for _, s in schedule[index:] if not state[s["id"]]["skip"]
+            ]
+            cancelled = len(outstanding)
+            for cut_id in outstanding:
+                state[cut_id]["cut_off"] = True
+            print(f"\n⏰ Deadline reached — cancelled {cancelled} outstanding requests")
+            break
+
+        date = today - timedelta(days=days_back)
+        if days_back != current_day:
+            current_day = days_back
+            print(f"\n📅 {date.strftime('%Y-%m-%d')}")
+
+        if source_state["degraded"] and days_back == 0:
+            print(f"  🩺 {source['name']} degraded — probing with one request first")
 
         scraper = SCRAPER_MODULES.get(source_id)
-        wods = []
+        result = None
+        started = time.monotonic()
+
+        try:
+            if scraper:
+                result = scraper.fetch_wod(date)
+            else:
+                result = generic.fetch_wod(date, source["url"])
+
+            if result:
+                source_state["wods"].append(result)
 
-        for days_back in range(0, 14):
-            date = today - timedelta(days=days_back)
+        except Exception as e:
+            print(f"  ❌ Error: {e}")
 
-            try:
-                if scraper:
-                    result = scraper.fetch_wod(date)
-                else:
-                    result = generic.fetch_wod(date, source_url)
+        source_state["latencies"].append(time.monotonic() - started)
 
-                if result:
-                    wods.append(result)
+        if source_state["degraded"] and days_back == 0 and not result:
+            print(f"  ⏭️ Probe failed — skipping remaining dates for {source['name']}")
+            source_state["skip"] = True
 
-            except Exception as e:
-                print(f"  ❌ Error: {e}")
+    for source in enabled_sources:
+        source_id = source["id"]
+        source_name = source["name"]
+        source_url = source["url"]
+        wods = state[source_id]["wods"]
+        latencies = state[source_id]["latencies"]
+
+        print(f"\n🔍 {source_name}")
+
+        # A source the deadline cut off without a WOD keeps its health as it
+        # was - an unfinished run says nothing about whether it is failing
+        entry = None
+        if wods or (latencies and not state[source_id]["cut_off"]):
+            entry = record_run(health, source_id, bool(wods), latencies)
 
         if not wods:
             print("  ⚠️ No WODs fetched — keeping existing data if any")
+            if entry:
+                print(
+                    f"  🩺 {entry['consecutive_failures']} failed run(s) in a row, "
+                    f"success rate {entry['success_rate']:.0%}"
+                )
             if source_id in existing_sources_map:
                 updated_sources.append(existing_sources_map[source_id])
             continue
 
+        existing_wods = existing_sources_map.get(source_id, {}).get("wods", [])
+        merged_wods, changes = merge_wods(existing_wods, wods)
+        summary[source_id] = changes
+
         updated_sources.append({
             "id": source_id,
             "name": source_name,
             "url": source_url,
-            "wods": sorted(wods, key=lambda x: x["date"], reverse=True)
+            "wods": merged_wods
         })
 
-        print(f"  ✅ {len(wods)} WODs saved")
+        print(
+            f"  ✅ {len(wods)} WODs fetched — "
+            f"{len(changes['added'])} new, {len(changes['changed'])} changed, "
+            f"{changes['unchanged']} unchanged"
+        )
+
+    save_health(HEALTH_FILE, health)
 
     if not updated_sources:
         print("\n❌ No sources updated — aborting save")
         return
 
-    output = {
-        "last_updated": datetime.now().isoformat(),
-        "sources": updated_sources
+    duplicates = find_duplicates(updated_sources)
+    if duplicates:
+        print(f"\n🔗 {len(duplicates)} duplicate WOD groups across sources")
+
+    content_changed = (
+        content_digest([updated_sources, duplicates])
+        != content_digest([
+            existing_data.get("sources", []),
+            existing_data.get("duplicates", [])
+        ])
+    )
+
+    run_meta = {
+        "last_run": datetime.now().isoformat(),
+        "content_changed": content_changed,
+        "deadline": deadline,
+        "cancelled_requests": cancelled,
+        "changes": summary
     }
-
-    save_json(WODS_FILE, output)
-    print("\n🎉 Fetch completed successfully")
+    save_json(RUN_META_FILE, run_meta)
+    write_step_summary(summary)
+
+    if content_changed:
+        output = {
+            "last_updated": run_meta["last_run"],
+            "sources": updated_sources,
+            "duplicates": duplicates
+        }
+        save_json(WODS_FILE, output)
+    else:
+        output = existing_data
+        print("\n💤 No WOD content changed — wods.json left untouched")
+
+    artifact = build_artifacts(output, DIST_DIR)
+    sizes = artifact["sizes"]
+    print(
+        f"\n📦 {artifact['file']}: {sizes['json']} B json, "
+        f"{sizes['gzip']} B gzip"
+        + (f", {sizes['brotli']} B brotli" if sizes["brotli"] else "")
+    )
+
+    if content_changed:
+        print("\n🎉 Fetch completed successfully")
 
 
 if __name__ == "__main__":
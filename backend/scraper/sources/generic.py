@@ -1,11 +1,16 @@
 """
 Generic WOD Scraper
 Best-effort scraper for unknown CrossFit sites
+- Learns the workout container per host and caches its selector across runs
+- Falls back to a full page scan when the learned selector finds nothing
 """
 
+import json
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
 import re
 
 
@@ -14,14 +19,214 @@ WORKOUT_KEYWORDS = [
     'run', 'row', 'bike', 'kg', 'lbs'
 ]
 
+# Keywords must start a word ("rowing", "10kg"), so "tomorrow" or "throw" don't count
+KEYWORD_RE = re.compile(
+    r'(?<![a-z])(?:' + '|'.join(re.escape(k) for k in WORKOUT_KEYWORDS) + r')'
+)
+
+# Whole-word keywords (plural allowed, "10kg" still counts) for the container
+# hit check, so "tomorrow", "brunch" or "throw" are not hits
+SCORE_RE = re.compile(
+    r'(?<![a-z])(?:' + '|'.join(re.escape(k) for k in WORKOUT_KEYWORDS) + r')s?(?![a-z])'
+)
+
+HEADER_TAGS = ['h1', 'h2', 'h3', 'h4']
+CONTAINER_TAGS = ['article', 'main', 'section', 'div']
+
+# A container needs at least this many whole-word keyword hits to be learned
+MIN_CONTAINER_HITS = 3
+
+SELECTORS_FILE = Path(__file__).resolve().parents[3] / 'data' / 'selectors.json'
+
+_selectors = None
+
 
 def clean_line(text: str) -> str:
     return re.sub(r'\s+', ' ', text).strip()
 
 
+def has_keyword(line: str) -> bool:
+    return KEYWORD_RE.search(line.lower()) is not None
+
+
 def looks_like_workout(lines):
-    text = ' '.join(lines).lower()
-    return any(k in text for k in WORKOUT_KEYWORDS)
+    return any(has_keyword(line) for line in lines)
+
+
+# --- Selector cache ---
+def load_selectors():
+    """Load learned per-host selectors (once per process)"""
+    global _selectors
+    if _selectors is None:
+        _selectors = {}
+        if SELECTORS_FILE.exists():
+            with open(SELECTORS_FILE, 'r', encoding='utf-8') as f:
+                _selectors = json.load(f)
+    return _selectors
+
+
+def save_selectors():
+    with open(SELECTORS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(load_selectors(), f, indent=2, ensure_ascii=False, sort_keys=True)
+
+
+def is_stable(token):
+    """Ids/classes with digits ("post-101") change per page and are avoided"""
+    return not any(c.isdigit() for c in token)
+
+
+def css_selector(el):
+    """
+    Build a CSS selector for an element that survives across pages:
+    tag.classes from its stable classes if unique, else a nth-of-type path
+    anchored at the nearest ancestor with a stable id
+    """
+    soup = next(p for p in el.parents if p.parent is None)
+
+    classes = [c for c in (el.get('class') or []) if is_stable(c)]
+    if classes:
+        selector = el.name + ''.join(f'.{c}' for c in classes)
+        try:
+            if soup.select_one(selector) is el:
+                return selector
+        except Exception:
+            pass  # class names that are not valid CSS
+
+    parts = []
+    node = el
+    while node is not None and node.name not in (None, '[document]'):
+        if node.get('id') and is_stable(node['id']):
+            parts.append(f"{node.name}#{node['id']}")
+            break
+        siblings = node.parent.find_all(node.name, recursive=False) if node.parent else [node]
+        index = next(i for i, s in enumerate(siblings, 1) if s is node)
+        parts.append(f"{node.name}:nth-of-type({index})")
+        node = node.parent
+
+    return ' > '.join(reversed(parts))
+
+
+def find_workout_container(soup):
+    """
+    Nearest common ancestor of every header/line the full scan keeps, i.e.
+    the smallest element that still holds all workout sections.
+    None if that is the whole page or it has too few keyword hits.
+    """
+    elements = [el for _, section_elements in scan_sections(soup)
+                for el in section_elements]
+    if not elements:
+        return None
+
+    common = [elements[0]] + list(elements[0].parents)
+    for el in elements[1:]:
+        ancestors = {id(a) for a in [el] + list(el.parents)}
+        common = [a for a in common if id(a) in ancestors]
+
+    container = next(
+        (a for a in common if a.name in CONTAINER_TAGS), None
+    )
+    if container is None:
+        return None
+
+    hits = len(SCORE_RE.findall(container.get_text(separator=' ').lower()))
+    return container if hits >= MIN_CONTAINER_HITS else None
+
+
+# --- Extraction ---
+def scan_sections(root):
+    """
+    Split the headers/paragraphs/list items under root into sections.
+    Returns: [(section, [elements it was built from]), ...] for workout sections
+    """
+    sections = []
+    current_section = None
+    current_elements = []
+    current_is_workout = False
+
+    # Prefer headers as section starters
+    for el in root.find_all(HEADER_TAGS + ['p', 'li']):
+        text = clean_line(el.get_text())
+        if not text or len(text) < 3:
+            continue
+
+        # Header → new section
+        if el.name in HEADER_TAGS:
+            if current_section and current_is_workout:
+                sections.append((current_section, current_elements))
+
+            current_section = {
+                'title': text,
+                'lines': []
+            }
+            current_elements = [el]
+            current_is_workout = False
+        else:
+            if current_section is None:
+                current_section = {
+                    'title': 'Workout',
+                    'lines': []
+                }
+
+            current_section['lines'].append(text)
+            current_elements.append(el)
+            current_is_workout = current_is_workout or has_keyword(text)
+
+    if current_section and current_is_workout:
+        sections.append((current_section, current_elements))
+
+    return sections
+
+
+def extract_sections(root):
+    return [section for section, _ in scan_sections(root)]
+
+
+def extract_with_learned_selector(soup, host):
+    """Parse only the learned container for host; None if it gave nothing"""
+    selectors = load_selectors()
+    learned = selectors.get(host)
+    if not learned:
+        return None
+
+    root = soup.select_one(learned['selector'])
+    if root is None:
+        print(f"  ⚠️ Learned selector for {host} stopped matching — full scan")
+        del selectors[host]
+        save_selectors()
+        return None
+
+    # Still matching but no workout today (e.g. rest day): keep the selector
+    return extract_sections(root) or None
+
+
+def learn_selector(soup, host):
+    """
+    Find the workout container on the page and remember it for host.
+    Only learned if parsing the container alone gives the same sections as
+    the full scan. Returns those sections, or None.
+    """
+    container = find_workout_container(soup)
+    if container is None:
+        return None
+
+    selector = css_selector(container)
+    try:
+        if not selector or soup.select_one(selector) is not container:
+            return None
+    except Exception:
+        return None  # class names that are not valid CSS
+
+    sections = extract_sections(container)
+    if not sections or sections != extract_sections(soup):
+        return None
+
+    # No timestamps: the file is committed and should only change with the selector
+    selectors = load_selectors()
+    if selectors.get(host) != {'selector': selector}:
+        selectors[host] = {'selector': selector}
+        save_selectors()
+        print(f"  🧠 Learned selector for {host}: {selector}")
+    return sections
 
 
 def fetch_wod(date: datetime, url: str):
@@ -44,37 +249,13 @@ def fetch_wod(date: datetime, url: str):
         ]):
             tag.decompose()
 
-        sections = []
-        current_section = None
-
-        # Prefer headers as section starters
-        elements = soup.find_all(['h1', 'h2', 'h3', 'h4', 'p', 'li'])
-
-        for el in elements:
-            text = clean_line(el.get_text())
-            if not text or len(text) < 3:
-                continue
-
-            # Header → new section
-            if el.name in ['h1', 'h2', 'h3', 'h4']:
-                if current_section and looks_like_workout(current_section['lines']):
-                    sections.append(current_section)
-
-                current_section = {
-                    'title': text,
-                    'lines': []
-                }
-            else:
-                if current_section is None:
-                    current_section = {
-                        'title': 'Workout',
-                        'lines': []
-                    }
-
-                current_section['lines'].append(text)
+        host = urlparse(url).netloc
 
-        if current_section and looks_like_workout(current_section['lines']):
-            sections.append(current_section)
+        sections = (
+            extract_with_learned_selector(soup, host)
+            or learn_selector(soup, host)
+            or extract_sections(soup)
+        )
 
         # Fallback: raw workout
         if not sections:
@@ -103,3 +284,44 @@ def fetch_wod(date: datetime, url: str):
     except Exception as e:
         print(f"  ❌ Generic scraper error: {e}")
         return None
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    SELECTORS_FILE = Path(tempfile.mkdtemp()) / 'selectors.json'
+    _selectors = {}
+    host = 'example.com'
+
+    def page(post_id, body):
+        return BeautifulSoup(
+            '<html><body><div class="site"><div class="menu"><p>Home</p><p>Shop</p></div>'
+            f'<article id="post-{post_id}" class="post-{post_id} post">{body}</article>'
+            '</div></body></html>',
+            'html.parser'
+        )
+
+    wod = (
+        '<h2>Warm up</h2><div class="warmup"><p>400m run</p><p>10 air squats</p></div>'
+        '<h2>Workout</h2><div class="wod"><p>AMRAP 12</p><p>10 reps thrusters 40kg</p>'
+        '<p>5 rounds row</p></div>'
+    )
+
+    # Sections wrapped in separate divs -> the whole article is learned
+    soup = page(101, wod)
+    full_scan = extract_sections(soup)
+    assert [s['title'] for s in full_scan] == ['Warm up', 'Workout']
+    assert learn_selector(soup, host) == full_scan
+    assert load_selectors()[host] == {'selector': 'article.post'}
+
+    # Per-post ids/classes on later days still match, nothing is rewritten
+    saved = SELECTORS_FILE.stat().st_mtime_ns
+    for post_id in (102, 103):
+        assert extract_with_learned_selector(page(post_id, wod), host) == full_scan
+        assert SELECTORS_FILE.stat().st_mtime_ns == saved
+
+    # A rest day keeps the learned selector
+    assert extract_with_learned_selector(page(104, '<h2>Rest day</h2><p>Recover</p>'), host) is None
+    assert load_selectors()[host] == {'selector': 'article.post'}
+
+    print("✅ generic scraper checks passed")